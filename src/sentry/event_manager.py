@@ -1919,9 +1919,7 @@ def _get_severity_metadata_for_group(
         return {}
 
     is_supported_platform = (
-        any(event.platform.startswith(platform) for platform in PLATFORMS_WITH_PRIORITY_ALERTS)
-        if event.platform
-        else False
+        event.platform.startswith(PLATFORMS_WITH_PRIORITY_ALERTS) if event.platform else False
     )
     if not is_supported_platform:
         return {}
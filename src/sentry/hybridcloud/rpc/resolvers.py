@@ -13,6 +13,7 @@ from sentry.types.region import (
     RegionResolutionError,
     get_region_by_name,
 )
+from sentry.utils.request_cache import request_cache
 
 
 class RegionResolutionStrategy(ABC):
@@ -25,14 +26,21 @@ class RegionResolutionStrategy(ABC):
 
     @staticmethod
     def _get_from_mapping(**query: Any) -> Region:
-        from sentry.models.organizationmapping import OrganizationMapping
+        region_name = _get_mapped_region_name(**query)
+        return get_region_by_name(region_name)
+
 
-        try:
-            mapping = OrganizationMapping.objects.get(**query)
-        except OrganizationMapping.DoesNotExist as e:
-            raise RegionMappingNotFound from e
+# Bulk code paths call the same remote method for one organization many times in a
+# row, so the mapping is looked up once per web request. Misses raise and are never
+# cached. Outside of a request (e.g. in tasks) every call queries the mapping.
+@request_cache
+def _get_mapped_region_name(**query: Any) -> str:
+    from sentry.models.organizationmapping import OrganizationMapping
 
-        return get_region_by_name(mapping.region_name)
+    try:
+        return OrganizationMapping.objects.values_list("region_name", flat=True).get(**query)
+    except OrganizationMapping.DoesNotExist as e:
+        raise RegionMappingNotFound from e
 
 
 @dataclass(frozen=True)
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import abc
+import copy
 import hashlib
 import hmac
 import importlib
-import inspect
 import logging
 import pkgutil
 from abc import abstractmethod
@@ -19,18 +19,21 @@ from collections.abc import (
 )
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
+from http.cookiejar import DefaultCookiePolicy
 from typing import TYPE_CHECKING, Any, NoReturn, Self, TypeVar, cast
 
 import django.urls
-import pydantic
+import orjson
 import requests
 import sentry_sdk
 from django.conf import settings
 from requests.adapters import HTTPAdapter, Retry
 
 from sentry import options
+from sentry.db.postgres.transactions import in_test_assert_no_transaction
 from sentry.hybridcloud.rpc import ArgumentDict, DelegatedBySiloMode, RpcModel
-from sentry.hybridcloud.rpc.sig import SerializableFunctionSignature
+from sentry.hybridcloud.rpc.sig import SerializableFunctionSignature, get_signature
 from sentry.silo.base import SiloMode, SingleProcessSiloModeState
 from sentry.types.region import Region, RegionMappingNotFound
 from sentry.utils import json, metrics
@@ -71,6 +74,19 @@ class RpcMethodSignature(SerializableFunctionSignature):
         super().__init__(base_method, is_instance_method=True)
         self._region_resolution = self._extract_region_resolution()
 
+    def for_service_cls(self, base_service_cls: type[RpcService]) -> RpcMethodSignature:
+        """Return this signature as declared on another service class.
+
+        The argument and return models only depend on the method, so they're shared with
+        the copy. Everything derived from the service class is rebuilt for it.
+        """
+        if base_service_cls is self.base_service_cls:
+            return self
+        signature = copy.copy(self)
+        signature.base_service_cls = base_service_cls
+        signature._region_resolution = signature._extract_region_resolution()
+        return signature
+
     def _setup_exception(self, message: str) -> RpcServiceSetupException:
         return RpcServiceSetupException(
             self.base_service_cls.__name__, self.base_function.__name__, message
@@ -153,16 +169,6 @@ class DelegatingRpcService(DelegatedBySiloMode["RpcService"]):
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self._base_service_cls.__name__})"
 
-    def deserialize_rpc_arguments(
-        self, method_name: str, serial_arguments: ArgumentDict
-    ) -> pydantic.BaseModel:
-        signature = self._signatures[method_name]
-        return signature.deserialize_arguments(serial_arguments)
-
-    def deserialize_rpc_response(self, method_name: str, serial_response: Any) -> Any:
-        signature = self._signatures[method_name]
-        return signature.deserialize_return_value(serial_response)
-
     def get_all_signatures(self) -> Iterable[RpcMethodSignature]:
         return self._signatures.values()
 
@@ -202,6 +208,13 @@ def regional_rpc_method(
 
 _global_service_registry: dict[str, DelegatingRpcService] = {}
 
+# Flat lookup of (service key, method name) to the delegating service and the
+# method's signature, so dispatching a call takes a single dict hit.
+_global_method_registry: dict[tuple[str, str], tuple[DelegatingRpcService, RpcMethodSignature]] = {}
+
+# Signatures keyed by the decorated method they were built from.
+_signatures_by_method: dict[Callable[..., Any], RpcMethodSignature] = {}
+
 
 class RpcService(abc.ABC):
     """A set of methods to be exposed as part of the RPC interface.
@@ -237,10 +250,27 @@ class RpcService(abc.ABC):
 
     @classmethod
     def _get_all_rpc_methods(cls) -> Iterator[Callable[..., Any]]:
-        for attr_name in dir(cls):
-            attr = getattr(cls, attr_name, None)
-            if callable(attr) and getattr(attr, _IS_RPC_METHOD_ATTR, False):
-                yield attr
+        # Cached on the class itself rather than inherited, since a subclass
+        # may add or override methods.
+        rpc_methods = cls.__dict__.get("_rpc_methods")
+        if rpc_methods is None:
+            rpc_methods = tuple(cls._scan_rpc_methods())
+            setattr(cls, "_rpc_methods", rpc_methods)
+        return iter(rpc_methods)
+
+    @classmethod
+    def _scan_rpc_methods(cls) -> Iterator[Callable[..., Any]]:
+        # Walk the MRO directly instead of `dir(cls)`, so that only the most
+        # derived definition of each name is considered, without a getattr
+        # for every unrelated attribute.
+        seen: set[str] = set()
+        for klass in cls.__mro__:
+            for attr_name, attr in vars(klass).items():
+                if attr_name in seen:
+                    continue
+                seen.add(attr_name)
+                if callable(attr) and getattr(attr, _IS_RPC_METHOD_ATTR, False):
+                    yield attr
 
     @classmethod
     def _get_abstract_rpc_methods(cls) -> Iterator[Callable[..., Any]]:
@@ -271,14 +301,19 @@ class RpcService(abc.ABC):
     @classmethod
     def _create_signatures(cls) -> Iterable[RpcMethodSignature]:
         for base_method in cls._get_all_rpc_methods():
-            try:
-                signature = RpcMethodSignature(cls, base_method)
-            except Exception as e:
-                raise RpcServiceSetupException(
-                    cls.key, base_method.__name__, "Error on parameter model"
-                ) from e
-            else:
-                yield signature
+            # Implementation and remote delegate subclasses inherit most of their
+            # RPC methods unchanged, so reuse the models built for the first class
+            # that declared the method instead of creating them again.
+            signature = _signatures_by_method.get(base_method)
+            if signature is None:
+                try:
+                    signature = RpcMethodSignature(cls, base_method)
+                except Exception as e:
+                    raise RpcServiceSetupException(
+                        cls.key, base_method.__name__, "Error on parameter model"
+                    ) from e
+                _signatures_by_method[base_method] = signature
+            yield signature.for_service_cls(cls)
 
     @classmethod
     def _get_and_validate_local_implementation(cls) -> RpcService:
@@ -290,7 +325,9 @@ class RpcService(abc.ABC):
             semantically equivalent annotations represented with unequal type tokens,
             such as `Optional[int]` versus `int | None`.
             """
-            sig = inspect.signature(method)
+            # Look up the underlying function of bound methods, so that the
+            # cached signature is shared; `self` is dropped below either way.
+            sig = get_signature(getattr(method, "__func__", method))
             param_names = list(sig.parameters.keys())
             if param_names and param_names[0] == "self":
                 del param_names[0]
@@ -352,7 +389,12 @@ class RpcService(abc.ABC):
 
                 serial_arguments = signature.serialize_arguments(kwargs)
                 return dispatch_remote_call(
-                    region, cls.key, method_name, serial_arguments, use_test_client=use_test_client
+                    region,
+                    cls.key,
+                    method_name,
+                    serial_arguments,
+                    use_test_client=use_test_client,
+                    signature=signature,
                 )
 
             return remote_method
@@ -377,6 +419,8 @@ class RpcService(abc.ABC):
         }
         service = DelegatingRpcService(cls, constructors, cls._signatures)
         _global_service_registry[cls.key] = service
+        for method_name, signature in cls._signatures.items():
+            _global_method_registry[(cls.key, method_name)] = (service, signature)
         # this returns a proxy which simulates the given class
         return service  # type: ignore[return-value]
 
@@ -423,46 +467,58 @@ class RpcResponseException(RpcException):
 
 def _look_up_service_method(
     service_name: str, method_name: str
-) -> tuple[DelegatingRpcService, Callable[..., Any]]:
+) -> tuple[DelegatingRpcService, RpcMethodSignature]:
     try:
-        service = _global_service_registry[service_name]
+        return _global_method_registry[(service_name, method_name)]
     except KeyError:
-        raise RpcResolutionException(f"Not a service name: {service_name!r}")
-
-    try:
-        method = getattr(service, method_name)
-    except AttributeError:
+        if service_name not in _global_service_registry:
+            raise RpcResolutionException(f"Not a service name: {service_name!r}")
         raise RpcResolutionException(f"Not a method name on {service_name!r}: {method_name!r}")
 
-    return service, method
-
 
 def dispatch_to_local_service(
     service_name: str, method_name: str, serial_arguments: ArgumentDict
 ) -> Any:
-    service, method = _look_up_service_method(service_name, method_name)
-    raw_arguments = service.deserialize_rpc_arguments(method_name, serial_arguments)
-    result = method(**raw_arguments.__dict__)
+    service, signature = _look_up_service_method(service_name, method_name)
+    raw_arguments = signature.deserialize_arguments_to_dict(serial_arguments)
+    method = getattr(service, method_name)
+    result = method(**raw_arguments)
+
+    return {
+        "meta": {},  # reserved for future use
+        "value": _result_to_dict(result),
+    }
 
-    def result_to_dict(value: Any) -> Any:
-        if isinstance(value, RpcModel):
-            return value.dict()
 
-        if isinstance(value, dict):
-            return {key: result_to_dict(val) for key, val in value.items()}
+_SCALAR_RESULT_TYPES = (str, int, float, bool, type(None))
 
-        if isinstance(value, Iterable) and not isinstance(value, str):
-            return [result_to_dict(item) for item in value]
 
+def _result_to_dict(value: Any) -> Any:
+    # Scalars are by far the most common leaves, so they're checked before the
+    # comparatively slow ABC check against `Iterable`.
+    if isinstance(value, _SCALAR_RESULT_TYPES):
         return value
 
-    return {
-        "meta": {},  # reserved for future use
-        "value": result_to_dict(result),
-    }
+    if isinstance(value, RpcModel):
+        return value.dict()
+
+    if isinstance(value, dict):
+        return {key: _result_to_dict(val) for key, val in value.items()}
+
+    if isinstance(value, Iterable):
+        return [_result_to_dict(item) for item in value]
+
+    return value
 
 
 _RPC_CONTENT_CHARSET = "utf-8"
+_RPC_CONTENT_TYPE = f"application/json; charset={_RPC_CONTENT_CHARSET}"
+
+
+def _encode_request_body(request_body: Mapping[str, Any]) -> bytes:
+    # Requests keep going through `json.dumps`: orjson encodes UUIDs, times, Decimals and
+    # named tuples differently and can't be told to defer to our default encoder for them.
+    return json.dumps(request_body).encode(_RPC_CONTENT_CHARSET)
 
 
 def dispatch_remote_call(
@@ -471,17 +527,82 @@ def dispatch_remote_call(
     method_name: str,
     serial_arguments: ArgumentDict,
     use_test_client: bool = False,
+    signature: RpcMethodSignature | None = None,
 ) -> Any:
-    remote_silo_call = _RemoteSiloCall(region, service_name, method_name, serial_arguments)
+    remote_silo_call = _RemoteSiloCall(
+        region, service_name, method_name, serial_arguments, signature=signature
+    )
     return remote_silo_call.dispatch(use_test_client)
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=2048)
+def _reverse_rpc_path(service_name: str, method_name: str) -> str:
+    return django.urls.reverse(
+        "sentry-api-0-rpc-service",
+        kwargs={"service_name": service_name, "method_name": method_name},
+    )
+
+
+# One connection pool is kept per silo address, each holding up to this many connections.
+_RPC_POOL_CONNECTIONS = 32
+_RPC_POOL_MAXSIZE = 64
+
+
+@lru_cache(maxsize=None)
+def _get_rpc_session(retry_count: int) -> requests.Session:
+    """Return a session shared by all RPC calls with the same retry count.
+
+    Reusing the session keeps connections to the other silos alive between
+    calls instead of paying for a new TCP and TLS handshake on every request.
+    Cookies are blocked, so that state can't leak between unrelated RPCs.
+    """
+    retry_adapter = HTTPAdapter(
+        pool_connections=_RPC_POOL_CONNECTIONS,
+        pool_maxsize=_RPC_POOL_MAXSIZE,
+        max_retries=Retry(
+            total=retry_count,
+            backoff_factor=0.1,
+            status_forcelist=[503],
+            allowed_methods=["POST"],
+        ),
+    )
+    http = requests.Session()
+    http.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    http.mount("http://", retry_adapter)
+    http.mount("https://", retry_adapter)
+    return http
+
+
 class _RemoteSiloCall:
-    region: Region | None
-    service_name: str
-    method_name: str
-    serial_arguments: ArgumentDict
+    # One of these is created for every outgoing call, so keep it light.
+    __slots__ = (
+        "region",
+        "service_name",
+        "method_name",
+        "serial_arguments",
+        "signature",
+        "_base_metrics_tags",
+    )
+
+    def __init__(
+        self,
+        region: Region | None,
+        service_name: str,
+        method_name: str,
+        serial_arguments: ArgumentDict,
+        signature: RpcMethodSignature | None = None,
+    ) -> None:
+        self.region = region
+        self.service_name = service_name
+        self.method_name = method_name
+        self.serial_arguments = serial_arguments
+        # Passed along by callers that already hold the signature, to spare a
+        # registry lookup when deserializing the response.
+        self.signature = signature
+        self._base_metrics_tags: Mapping[str, str | int | None] = {
+            "rpc_destination_region": region.name if region else "control",
+            "rpc_method": f"{service_name}.{method_name}",
+        }
 
     @property
     def address(self) -> str:
@@ -502,24 +623,21 @@ class _RemoteSiloCall:
 
     @property
     def path(self) -> str:
-        return django.urls.reverse(
-            "sentry-api-0-rpc-service",
-            kwargs={"service_name": self.service_name, "method_name": self.method_name},
-        )
+        return _reverse_rpc_path(self.service_name, self.method_name)
 
     def dispatch(self, use_test_client: bool = False) -> Any:
         serial_response = self._send_to_remote_silo(use_test_client)
 
         return_value = serial_response["value"]
-        service, _ = _look_up_service_method(self.service_name, self.method_name)
-        return service.deserialize_rpc_response(self.method_name, return_value)
+        signature = self.signature
+        if signature is None:
+            _, signature = _look_up_service_method(self.service_name, self.method_name)
+        return signature.deserialize_return_value(return_value)
 
     def _metrics_tags(self, **additional_tags: str | int) -> Mapping[str, str | int | None]:
-        return dict(
-            rpc_destination_region=self.region.name if self.region else "control",
-            rpc_method=f"{self.service_name}.{self.method_name}",
-            **additional_tags,
-        )
+        if not additional_tags:
+            return self._base_metrics_tags
+        return {**self._base_metrics_tags, **additional_tags}
 
     def get_method_retry_count(self) -> int:
         retry_key = f"{self.service_name}.{self.method_name}"
@@ -559,10 +677,10 @@ class _RemoteSiloCall:
             "meta": {},  # reserved for future use
             "args": self.serial_arguments,
         }
-        data = json.dumps(request_body).encode(_RPC_CONTENT_CHARSET)
+        data = _encode_request_body(request_body)
         signature = generate_request_signature(self.path, data)
         headers = {
-            "Content-Type": f"application/json; charset={_RPC_CONTENT_CHARSET}",
+            "Content-Type": _RPC_CONTENT_TYPE,
             "Authorization": f"Rpcsignature {signature}",
         }
 
@@ -578,12 +696,19 @@ class _RemoteSiloCall:
             )
 
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             self._raise_from_response_status_error(response)
 
     @contextmanager
     def _open_request_context(self) -> Generator[None]:
         timer = metrics.timer("hybrid_cloud.dispatch_rpc.duration", tags=self._metrics_tags())
+        if sentry_sdk.get_current_span() is None:
+            # Outside of a transaction the span would never be sent anywhere, so
+            # don't pay for creating it.
+            with timer:
+                yield
+            return
+
         span = sentry_sdk.start_span(
             op="hybrid_cloud.dispatch_rpc",
             name=f"rpc to {self.service_name}.{self.method_name}",
@@ -626,8 +751,6 @@ class _RemoteSiloCall:
     def _fire_test_request(self, headers: Mapping[str, str], data: bytes) -> Any:
         from django.test import Client
 
-        from sentry.db.postgres.transactions import in_test_assert_no_transaction
-
         in_test_assert_no_transaction(
             f"remote service method to {self.path} called inside transaction!  Move service calls to outside of transactions."
         )
@@ -647,20 +770,7 @@ class _RemoteSiloCall:
             return Client().post(self.path, data, headers["Content-Type"], **extra)
 
     def _fire_request(self, headers: MutableMapping[str, str], data: bytes) -> requests.Response:
-        retry_count = self.get_method_retry_count()
-        retry_adapter = HTTPAdapter(
-            max_retries=Retry(
-                total=retry_count,
-                backoff_factor=0.1,
-                status_forcelist=[503],
-                allowed_methods=["POST"],
-            )
-        )
-        http = requests.Session()
-        http.mount("http://", retry_adapter)
-        http.mount("https://", retry_adapter)
-
-        # TODO: Performance considerations (persistent connections, pooling, etc.)?
+        http = _get_rpc_session(self.get_method_retry_count())
         url = self.address + self.path
 
         timeout = self.get_method_timeout()
@@ -700,6 +810,38 @@ class RpcAuthenticationSetupException(Exception):
     """Indicates an error in declaring the settings for RPC authentication."""
 
 
+@lru_cache(maxsize=512)
+def _get_signature_prefix(url_path: str) -> bytes:
+    return url_path.encode("utf8") + b":"
+
+
+class _RpcSigner:
+    """Sign RPC requests with a single shared secret.
+
+    The keyed HMAC is built once and copied for each signature, which skips
+    re-deriving the inner and outer pads on every request.
+    """
+
+    __slots__ = ("_prototype",)
+
+    def __init__(self, key: str) -> None:
+        self._prototype = hmac.new(key.encode("utf-8"), digestmod=hashlib.sha256)
+
+    def sign(self, url_path: str, body: bytes) -> hmac.HMAC:
+        computed = self._prototype.copy()
+        # Equivalent to signing `b"<path>:<body>"`, without copying the body into
+        # a new bytes object first.
+        computed.update(_get_signature_prefix(url_path))
+        computed.update(body)
+        return computed
+
+
+@lru_cache(maxsize=None)
+def _get_signer(key: str) -> _RpcSigner:
+    # Keyed on the secret itself, so a key rotation just adds an entry.
+    return _RpcSigner(key)
+
+
 def compare_signature(url: str, body: bytes, signature: str) -> bool:
     """
     Compare request data + signature signed by one of the shared secrets.
@@ -716,16 +858,17 @@ def compare_signature(url: str, body: bytes, signature: str) -> bool:
         return False
 
     # We aren't using the version bits currently, but might use them in the future.
-    _, signature_data = signature.split(":", 2)
-    signature_input = b"%s:%s" % (
-        url.encode("utf8"),
-        body,
-    )
+    _, _, signature_data = signature.partition(":")
+
+    try:
+        signature_bytes = bytes.fromhex(signature_data)
+    except ValueError:
+        return False
 
     for key in settings.RPC_SHARED_SECRET:
-        computed = hmac.new(key.encode("utf-8"), signature_input, hashlib.sha256).hexdigest()
+        computed = _get_signer(key).sign(url, body).digest()
 
-        is_valid = hmac.compare_digest(computed.encode("utf-8"), signature_data.encode("utf-8"))
+        is_valid = hmac.compare_digest(computed, signature_bytes)
         if is_valid:
             return True
 
@@ -742,10 +885,6 @@ def generate_request_signature(url_path: str, body: bytes) -> str:
     if not settings.RPC_SHARED_SECRET:
         raise RpcAuthenticationSetupException("Cannot sign RPC requests without RPC_SHARED_SECRET")
 
-    signature_input = b"%s:%s" % (
-        url_path.encode("utf8"),
-        body,
-    )
     secret = settings.RPC_SHARED_SECRET[0]
-    signature = hmac.new(secret.encode("utf-8"), signature_input, hashlib.sha256).hexdigest()
+    signature = _get_signer(secret).sign(url_path, body).hexdigest()
     return f"rpc0:{signature}"
@@ -3,6 +3,7 @@ from __future__ import annotations
 import inspect
 import itertools
 from collections.abc import Callable, Iterable, Sequence
+from functools import lru_cache
 from typing import Any
 
 import pydantic
@@ -11,6 +12,16 @@ from django.utils.functional import LazyObject
 from sentry.hybridcloud.rpc import ArgumentDict
 
 
+@lru_cache(maxsize=None)
+def get_signature(function: Callable[..., Any]) -> inspect.Signature:
+    """Return `inspect.signature(function)`, computed once per function.
+
+    Building a signature is slow, and it is needed more than once for every
+    method when setting up services.
+    """
+    return inspect.signature(function)
+
+
 class _SerializableFunctionSignatureException(Exception):
     def __init__(self, signature: SerializableFunctionSignature, message: str) -> None:
         super().__init__(f"{signature.generate_name('.')}: {message}")
@@ -34,6 +45,8 @@ class SerializableFunctionSignature:
 
         self._parameter_model = self._create_parameter_model()
         self._return_model = self._create_return_model()
+        return_annotation = get_signature(base_function).return_annotation
+        self._returns_none = return_annotation is None or return_annotation is type(None)
 
     def get_name_segments(self) -> Sequence[str]:
         return (self.base_function.__name__,)
@@ -77,7 +90,7 @@ class SerializableFunctionSignature:
             return param.annotation, default_value
 
         model_name = self.generate_name("__", "ParameterModel")
-        parameters = list(inspect.signature(self.base_function).parameters.values())
+        parameters = list(get_signature(self.base_function).parameters.values())
         if self.is_instance_method:
             parameters = parameters[1:]  # exclude `self` argument
         field_definitions = {p.name: create_field(p) for p in parameters}
@@ -94,7 +107,7 @@ class SerializableFunctionSignature:
         where we can't directly access an RpcModel class on which to call `parse_obj`.
         """
         model_name = self.generate_name("__", "ReturnModel")
-        return_type = inspect.signature(self.base_function).return_annotation
+        return_type = get_signature(self.base_function).return_annotation
         if return_type is None:
             return_type = type(None)
         self._validate_type_token("return type", return_type)
@@ -119,9 +132,11 @@ class SerializableFunctionSignature:
             return arg
 
     def serialize_arguments(self, raw_arguments: ArgumentDict) -> ArgumentDict:
-        raw_arguments = {
-            key: self._unwrap_lazy_django_object(arg) for (key, arg) in raw_arguments.items()
-        }
+        # Lazy objects are rare, so avoid copying the arguments unless there is one.
+        if any(isinstance(arg, LazyObject) for arg in raw_arguments.values()):
+            raw_arguments = {
+                key: self._unwrap_lazy_django_object(arg) for (key, arg) in raw_arguments.items()
+            }
 
         try:
             model_instance = self._parameter_model(**raw_arguments)
@@ -129,15 +144,39 @@ class SerializableFunctionSignature:
             raise SerializableFunctionValueException(self, "Could not serialize arguments") from e
         return model_instance.dict()
 
+    @staticmethod
+    def _validate_values(
+        model: type[pydantic.BaseModel], input_data: ArgumentDict
+    ) -> dict[str, Any]:
+        """Validate data against a model without constructing a model instance."""
+        values, _, error = pydantic.validate_model(model, input_data)
+        if error is not None:
+            raise error
+        return values
+
     def deserialize_arguments(self, serial_arguments: ArgumentDict) -> pydantic.BaseModel:
         try:
             return self._parameter_model.parse_obj(serial_arguments)
         except Exception as e:
             raise SerializableFunctionValueException(self, "Could not deserialize arguments") from e
 
+    def deserialize_arguments_to_dict(self, serial_arguments: ArgumentDict) -> dict[str, Any]:
+        """Deserialize arguments directly into keyword arguments for the function.
+
+        This is equivalent to the `__dict__` of `deserialize_arguments`'s result, but
+        skips instantiating the parameter model.
+        """
+        try:
+            return self._validate_values(self._parameter_model, serial_arguments)
+        except Exception as e:
+            raise SerializableFunctionValueException(self, "Could not deserialize arguments") from e
+
     def deserialize_return_value(self, value: Any) -> Any:
-        parsed = self._return_model.parse_obj({self._RETURN_MODEL_ATTR: value})
-        return getattr(parsed, self._RETURN_MODEL_ATTR)
+        if value is None and self._returns_none:
+            # Nothing to validate; skip running the return model.
+            return None
+        values = self._validate_values(self._return_model, {self._RETURN_MODEL_ATTR: value})
+        return values[self._RETURN_MODEL_ATTR]
 
     def get_schemas(self) -> tuple[type[pydantic.BaseModel], type[pydantic.BaseModel]]:
         """Access the schema representations directly.
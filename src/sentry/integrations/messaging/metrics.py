@@ -28,7 +28,7 @@ class MessagingInteractionType(StrEnum):
     ARCHIVE = "ARCHIVE"
     ASSIGN_DIALOG = "ASSIGN_DIALOG"
     ASSIGN = "ASSIGN"
-    UNASSIGN = "ASSIGN"
+    UNASSIGN = "UNASSIGN"
     RESOLVE_DIALOG = "RESOLVE_DIALOG"
     RESOLVE = "RESOLVE"
     UNRESOLVE = "UNRESOLVE"
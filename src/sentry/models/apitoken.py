@@ -289,7 +289,7 @@ class ApiToken(ReplicatedControlModel, HasApiScopes):
             return self.application.get_allowed_origins()
         return ()
 
-    def refresh(self, expires_at=None):
+    def refresh(self, expires_at=None, **kwargs: Any) -> None:
         if self.token_type == AuthTokenType.USER:
             raise NotSupported("User auth tokens do not support refreshing the token")
 
@@ -299,7 +299,9 @@ class ApiToken(ReplicatedControlModel, HasApiScopes):
         new_token = generate_token(token_type=self.token_type)
         new_refresh_token = generate_token(token_type=self.token_type)
 
-        self.update(token=new_token, refresh_token=new_refresh_token, expires_at=expires_at)
+        self.update(
+            token=new_token, refresh_token=new_refresh_token, expires_at=expires_at, **kwargs
+        )
 
     def get_relocation_scope(self) -> RelocationScope:
         if self.application_id is not None:
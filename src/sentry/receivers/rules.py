@@ -23,15 +23,14 @@ DEFAULT_RULE_DATA = {
 
 
 # TODO(snigdha): Remove this constant when seer-based-priority is GA
-PLATFORMS_WITH_PRIORITY_ALERTS = ["python", "javascript"]
+PLATFORMS_WITH_PRIORITY_ALERTS = ("python", "javascript")
 
 
 def create_default_rules(project: Project, default_rules=True, RuleModel=Rule, **kwargs):
     if not default_rules:
         return
 
-    rule_data = DEFAULT_RULE_DATA
-    RuleModel.objects.create(project=project, label=DEFAULT_RULE_LABEL, data=rule_data)
+    RuleModel.objects.create(project=project, label=DEFAULT_RULE_LABEL, data=DEFAULT_RULE_DATA)
 
 
 project_created.connect(create_default_rules, dispatch_uid="create_default_rules", weak=False)
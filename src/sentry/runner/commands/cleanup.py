@@ -1,23 +1,30 @@
 from __future__ import annotations
 
 import os
+import queue
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import timedelta
+from multiprocessing import Event
 from multiprocessing import JoinableQueue as Queue
 from multiprocessing import Process
-from typing import Any, Final, Literal, TypeAlias
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeAlias
 from uuid import uuid4
 
 import click
 import sentry_sdk
 from django.conf import settings
-from django.db.models import Model, QuerySet
+from django.db.models import Exists, Model, OuterRef, QuerySet
 from django.utils import timezone
 
 from sentry.runner.decorators import log_options
 from sentry.silo.base import SiloLimit, SiloMode
 
+if TYPE_CHECKING:
+    from multiprocessing.synchronize import Event as EventType
+
+    from sentry.db.deletion import BulkDeleteQuery
+
 
 def get_project(value: str) -> int | None:
     from sentry.models.project import Project
@@ -33,16 +40,50 @@ def get_project(value: str) -> int | None:
         return None
 
 
-# We need a unique value to indicate when to stop multiprocessing queue
-# an identity on an object() isn't guaranteed to work between parent
-# and child proc
-_STOP_WORKER: Final = "91650ec271ae4b3e8a67cdc909d80f8c"
-_WorkQueue: TypeAlias = (
-    "Queue[Literal['91650ec271ae4b3e8a67cdc909d80f8c'] | tuple[str, tuple[int, ...]]]"
-)
+class _DeletesTask(NamedTuple):
+    """Delete chunks of ids through the deletions code path."""
+
+    model_name: str
+    chunks: list[tuple[int, ...]]
+
+
+class _BulkQueryDeleteTask(NamedTuple):
+    """Run a whole `BulkDeleteQuery` inside a worker."""
+
+    model_name: str
+    dtfield: str
+    days: int
+    project_id: int | None
+    order_by: str | None
+
+
+class _ProjectDeleteTask(NamedTuple):
+    """Sweep a model for one project. The worker expands it into `_DeletesTask`s on the shared
+    queue, so the chunks of a large project are still spread over every worker."""
+
+    model_name: str
+    dtfield: str
+    days: int
+    order_by: str
+    project_id: int
+
+
+_WorkQueue: TypeAlias = "Queue[_DeletesTask | _BulkQueryDeleteTask | _ProjectDeleteTask]"
 
 API_TOKEN_TTL_IN_DAYS = 30
 
+# Above this many projects, DELETES_BY_PROJECT pages through project ids
+# instead of loading them all into memory up front.
+MAX_MATERIALIZED_PROJECT_IDS = 100_000
+
+# Number of ids deleted at once by the deletions code path, and how many of
+# those chunks are handed to a worker per task.
+DELETES_CHUNK_SIZE = 1000
+DELETES_CHUNKS_PER_TASK = 10
+
+# Number of project ids enqueued at a time by DELETES_BY_PROJECT.
+PROJECT_SHARD_BATCH_SIZE = 10_000
+
 
 def debug_output(msg: str) -> None:
     if os.environ.get("SENTRY_CLEANUP_SILENT", None):
@@ -50,7 +91,7 @@ def debug_output(msg: str) -> None:
     click.echo(msg)
 
 
-def multiprocess_worker(task_queue: _WorkQueue) -> None:
+def multiprocess_worker(task_queue: _WorkQueue, shutdown_event: EventType) -> None:
     # Configure within each Process
     import logging
 
@@ -63,6 +104,8 @@ def multiprocess_worker(task_queue: _WorkQueue) -> None:
     configure()
 
     from sentry import deletions, models, similarity
+    from sentry.db.deletion import BulkDeleteQuery
+    from sentry.utils.iterators import chunked
 
     skip_models = [
         # Handled by other parts of cleanup
@@ -75,26 +118,71 @@ def multiprocess_worker(task_queue: _WorkQueue) -> None:
         similarity,
     ]
 
-    while True:
-        j = task_queue.get()
-        if j == _STOP_WORKER:
-            task_queue.task_done()
+    # Tasks only ever reference a handful of models, so resolve each dotted
+    # path once per worker rather than once per task.
+    model_cache: dict[str, type[Model]] = {}
+
+    def get_model(model_name: str) -> type[Model]:
+        model = model_cache.get(model_name)
+        if model is None:
+            model = model_cache[model_name] = import_string(model_name)
+        return model
+
+    def delete_chunks(model: type[Model], chunks: Iterable[tuple[int, ...]]) -> None:
+        for chunk in chunks:
+            try:
+                task = deletions.get(
+                    model=model,
+                    query={"id__in": chunk},
+                    skip_models=skip_models,
+                    transaction_id=uuid4().hex,
+                )
 
-            return
+                while True:
+                    if not task.chunk():
+                        break
+            except Exception as e:
+                logger.exception(e)
 
-        model_name, chunk = j
-        model = import_string(model_name)
+    # Keep draining the queue until the parent signals that no more work will
+    # be enqueued and everything already enqueued has been picked up.
+    while not (shutdown_event.is_set() and task_queue.empty()):
         try:
-            task = deletions.get(
-                model=model,
-                query={"id__in": chunk},
-                skip_models=skip_models,
-                transaction_id=uuid4().hex,
-            )
+            j = task_queue.get(timeout=1)
+        except queue.Empty:
+            continue
 
-            while True:
-                if not task.chunk():
-                    break
+        try:
+            if isinstance(j, _BulkQueryDeleteTask):
+                BulkDeleteQuery(
+                    model=get_model(j.model_name),
+                    dtfield=j.dtfield,
+                    days=j.days,
+                    project_id=j.project_id,
+                    order_by=j.order_by,
+                ).execute(chunk_size=10000)
+            elif isinstance(j, _ProjectDeleteTask):
+                model = get_model(j.model_name)
+                q = BulkDeleteQuery(
+                    model=model,
+                    dtfield=j.dtfield,
+                    days=j.days,
+                    project_id=j.project_id,
+                    order_by=j.order_by,
+                )
+                # Hand the chunks back to the pool rather than deleting them here, so a
+                # project holding most of the rows doesn't pin all of its work on one
+                # worker. Never block on a full queue though: every worker could end up
+                # waiting on it with nobody left to drain it.
+                for chunks in chunked(
+                    q.iterator(chunk_size=DELETES_CHUNK_SIZE), DELETES_CHUNKS_PER_TASK
+                ):
+                    try:
+                        task_queue.put_nowait(_DeletesTask(j.model_name, chunks))
+                    except queue.Full:
+                        delete_chunks(model, chunks)
+            else:
+                delete_chunks(get_model(j.model_name), j.chunks)
         except Exception as e:
             logger.exception(e)
         finally:
@@ -153,9 +241,12 @@ def cleanup(
     # before we import or configure the app
 
     pool = []
-    task_queue: _WorkQueue = Queue(1000)
+    # Keep only a few chunks per worker buffered so the parent doesn't hold
+    # large amounts of pending work in memory.
+    task_queue: _WorkQueue = Queue(max(16, concurrency * 4))
+    shutdown_event = Event()
     for _ in range(concurrency):
-        p = Process(target=multiprocess_worker, args=(task_queue,))
+        p = Process(target=multiprocess_worker, args=(task_queue, shutdown_event))
         p.daemon = True
         p.start()
         pool.append(p)
@@ -169,7 +260,7 @@ def cleanup(
 
         from sentry.db.deletion import BulkDeleteQuery
         from sentry.utils import metrics
-        from sentry.utils.query import RangeQuerySetWrapper
+        from sentry.utils.iterators import chunked
 
         start_time = None
         if timed:
@@ -216,7 +307,9 @@ def cleanup(
             else:
                 remove_old_nodestore_values(days)
 
-        run_bulk_query_deletes(bulk_query_deletes, is_filtered, days, project, project_id)
+        run_bulk_query_deletes(
+            task_queue, bulk_query_deletes, is_filtered, days, project, project_id
+        )
 
         debug_output("Running bulk deletes in DELETES")
         for model_tp, dtfield, order_by in deletes:
@@ -235,8 +328,7 @@ def cleanup(
                     order_by=order_by,
                 )
 
-                for chunk in q.iterator(chunk_size=100):
-                    task_queue.put((imp, chunk))
+                enqueue_deletes(task_queue, imp, q)
 
                 task_queue.join()
 
@@ -246,36 +338,30 @@ def cleanup(
 
         if project_deletion_query is not None and len(to_delete_by_project):
             debug_output("Running bulk deletes in DELETES_BY_PROJECT")
-            for project_id_for_deletion in RangeQuerySetWrapper(
-                project_deletion_query.values_list("id", flat=True),
-                result_value_getter=lambda item: item,
-            ):
+            project_ids_for_deletion: Iterable[int]
+            if project_id is not None:
+                # A single project was requested, there's no need to query for it
+                project_ids_for_deletion = [project_id]
+            else:
+                project_ids_for_deletion = get_project_ids_for_deletion(project_deletion_query)
+
+            for project_ids in chunked(project_ids_for_deletion, PROJECT_SHARD_BATCH_SIZE):
                 for model_tp, dtfield, order_by in to_delete_by_project:
                     debug_output(
-                        f"Removing {model_tp.__name__} for days={days} project={project_id_for_deletion}"
+                        f"Removing {model_tp.__name__} for days={days} projects={len(project_ids)}"
                     )
 
-                    imp = ".".join((model_tp.__module__, model_tp.__name__))
-
-                    q = BulkDeleteQuery(
-                        model=model_tp,
-                        dtfield=dtfield,
-                        days=days,
-                        project_id=project_id_for_deletion,
-                        order_by=order_by,
+                    enqueue_project_deletes(
+                        task_queue, model_tp, dtfield, days, order_by, project_ids
                     )
 
-                    for chunk in q.iterator(chunk_size=100):
-                        task_queue.put((imp, chunk))
-
         task_queue.join()
 
         remove_file_blobs(is_filtered, silent)
 
     finally:
         # Shut down our pool
-        for _ in pool:
-            task_queue.put(_STOP_WORKER)
+        shutdown_event.set()
 
         # And wait for it to drain
         for p in pool:
@@ -290,6 +376,30 @@ def cleanup(
         transaction.__exit__(None, None, None)
 
 
+def enqueue_deletes(task_queue: _WorkQueue, model_name: str, query: BulkDeleteQuery) -> None:
+    from sentry.utils.iterators import chunked
+
+    # Group several chunks per task so workers resolve the model once for all of them
+    for chunks in chunked(query.iterator(chunk_size=DELETES_CHUNK_SIZE), DELETES_CHUNKS_PER_TASK):
+        task_queue.put(_DeletesTask(model_name, chunks))
+
+
+def enqueue_project_deletes(
+    task_queue: _WorkQueue,
+    model_tp: type[Model],
+    dtfield: str,
+    days: int,
+    order_by: str,
+    project_ids: list[int],
+) -> None:
+    imp = ".".join((model_tp.__module__, model_tp.__name__))
+
+    # One task per (model, project): workers walk the projects' ids in parallel, so the
+    # parent doesn't become the bottleneck feeding the queue.
+    for project_id in project_ids:
+        task_queue.put(_ProjectDeleteTask(imp, dtfield, days, order_by, project_id))
+
+
 def remove_expired_values_for_lost_passwords(is_filtered: Callable[[type[Model]], bool]) -> None:
     from sentry.users.models.lostpasswordhash import LostPasswordHash
 
@@ -297,9 +407,12 @@ def remove_expired_values_for_lost_passwords(is_filtered: Callable[[type[Model]]
     if is_filtered(LostPasswordHash):
         debug_output(">> Skipping LostPasswordHash")
     else:
-        LostPasswordHash.objects.filter(
+        queryset = LostPasswordHash.objects.filter(
             date_added__lte=timezone.now() - timedelta(hours=48)
-        ).delete()
+        )
+        # Nothing references LostPasswordHash and there are no delete signal
+        # receivers for it, so skip the collector and delete in a single query.
+        queryset._raw_delete(queryset.db)
 
 
 def remove_expired_values_for_org_members(
@@ -318,6 +431,7 @@ def remove_expired_values_for_org_members(
 def delete_api_models(is_filtered: Callable[[type[Model]], bool]) -> None:
     from sentry.models.apigrant import ApiGrant
     from sentry.models.apitoken import ApiToken
+    from sentry.sentry_apps.models.sentry_app_installation import SentryAppInstallation
 
     for model_tp in (ApiGrant, ApiToken):
         debug_output(f"Removing expired values for {model_tp.__name__}")
@@ -329,18 +443,28 @@ def delete_api_models(is_filtered: Callable[[type[Model]], bool]) -> None:
                 expires_at__lt=(timezone.now() - timedelta(days=API_TOKEN_TTL_IN_DAYS))
             )
 
-            # SentryAppInstallations are associated to ApiTokens. We're okay
-            # with these tokens sticking around so that the Integration can
-            # refresh them, but all other non-associated tokens should be
-            # deleted.
             if model_tp is ApiToken:
-                queryset = queryset.filter(sentry_app_installation__isnull=True)
-
-            queryset.delete()
+                # SentryAppInstallations are associated to ApiTokens. We're okay
+                # with these tokens sticking around so that the Integration can
+                # refresh them, but all other non-associated tokens should be
+                # deleted.
+                #
+                # ApiTokens produce outboxes and have dependent rows, so they
+                # keep going through the regular deletion collector.
+                queryset.filter(sentry_app_installation__isnull=True).delete()
+            else:
+                # ApiGrant has no delete signal receivers and its only dependent
+                # is the nullable SentryAppInstallation.api_grant, so clear that
+                # reference the way the collector would and delete in one query.
+                SentryAppInstallation.with_deleted.filter(api_grant__in=queryset).update(
+                    api_grant=None
+                )
+                queryset._raw_delete(queryset.db)
 
 
 def exported_data(is_filtered: Callable[[type[Model]], bool], silent: bool) -> None:
     from sentry.data_export.models import ExportedData
+    from sentry.utils.query import RangeQuerySetWrapper
 
     if not silent:
         click.echo("Removing expired files associated with ExportedData")
@@ -348,8 +472,12 @@ def exported_data(is_filtered: Callable[[type[Model]], bool], silent: bool) -> N
     if is_filtered(ExportedData):
         debug_output(">> Skipping ExportedData files")
     else:
-        export_data_queryset = ExportedData.objects.filter(date_expired__lt=(timezone.now()))
-        for item in export_data_queryset:
+        # `delete_file` only needs the file reference, so avoid pulling the
+        # (potentially large) query payload of every expired export.
+        export_data_queryset = ExportedData.objects.filter(
+            date_expired__lt=timezone.now(), file_id__isnull=False
+        ).only("id", "file_id")
+        for item in RangeQuerySetWrapper(export_data_queryset):
             item.delete_file()
 
 
@@ -427,29 +555,25 @@ def generate_bulk_query_deletes() -> list[tuple[type[Model], str, str | None]]:
 
 
 def run_bulk_query_deletes(
+    task_queue: _WorkQueue,
     bulk_query_deletes: list[tuple[type[Model], str, str | None]],
     is_filtered: Callable[[type[Model]], bool],
     days: int,
     project: str | None,
     project_id: int | None,
 ) -> None:
-    from sentry.db.deletion import BulkDeleteQuery
-
     debug_output("Running bulk query deletes in bulk_query_deletes")
     for model_tp, dtfield, order_by in bulk_query_deletes:
-        chunk_size = 10000
-
         debug_output(f"Removing {model_tp.__name__} for days={days} project={project or '*'}")
         if is_filtered(model_tp):
             debug_output(">> Skipping %s" % model_tp.__name__)
         else:
-            BulkDeleteQuery(
-                model=model_tp,
-                dtfield=dtfield,
-                days=days,
-                project_id=project_id,
-                order_by=order_by,
-            ).execute(chunk_size=chunk_size)
+            # The queries touch independent tables, so let the worker pool run
+            # them concurrently instead of executing them one after another.
+            imp = ".".join((model_tp.__module__, model_tp.__name__))
+            task_queue.put(_BulkQueryDeleteTask(imp, dtfield, days, project_id, order_by))
+
+    task_queue.join()
 
 
 def prepare_deletes_by_project(
@@ -486,6 +610,19 @@ def prepare_deletes_by_project(
     return project_deletion_query, to_delete_by_project
 
 
+def get_project_ids_for_deletion(project_deletion_query: QuerySet[Any]) -> Iterable[int]:
+    from sentry.utils.query import RangeQuerySetWrapper
+
+    project_ids = project_deletion_query.values_list("id", flat=True)
+
+    # Load the ids with a single query when there aren't too many of them,
+    # otherwise page through them.
+    if project_ids.count() <= MAX_MATERIALIZED_PROJECT_IDS:
+        return list(project_ids.order_by("id"))
+
+    return RangeQuerySetWrapper(project_ids, result_value_getter=lambda item: item)
+
+
 def remove_file_blobs(is_filtered: Callable[[type[Model]], bool], silent: bool) -> None:
     from sentry.models.file import FileBlob
 
@@ -510,18 +647,28 @@ def cleanup_unused_files(quiet: bool = False) -> None:
     from sentry.models.files.file import File
     from sentry.models.files.fileblob import FileBlob
     from sentry.models.files.fileblobindex import FileBlobIndex
-
-    if quiet:
-        from sentry.utils.query import RangeQuerySetWrapper
-    else:
-        from sentry.utils.query import RangeQuerySetWrapperWithProgressBar as RangeQuerySetWrapper
+    from sentry.utils.iterators import chunked
+    from sentry.utils.query import WithProgressBar
 
     cutoff = timezone.now() - timedelta(days=1)
-    queryset = FileBlob.objects.filter(timestamp__lte=cutoff)
 
-    for blob in RangeQuerySetWrapper(queryset):
-        if FileBlobIndex.objects.filter(blob=blob).exists():
-            continue
-        if File.objects.filter(blob=blob).exists():
-            continue
-        blob.delete()
+    # Compute the full set of orphaned blobs in the database with a single
+    # anti-join rather than probing FileBlobIndex and File for every blob.
+    queryset = (
+        FileBlob.objects.filter(timestamp__lte=cutoff)
+        .exclude(Exists(FileBlobIndex.objects.filter(blob_id=OuterRef("id"))))
+        .exclude(Exists(File.objects.filter(blob_id=OuterRef("id"))))
+    )
+    orphan_ids = set(queryset.values_list("id", flat=True))
+
+    chunks: Iterable[list[int]] = list(chunked(sorted(orphan_ids), 1000))
+    if not quiet:
+        debug_output(f">> Found {len(orphan_ids)} unused FileBlob(s)")
+        chunks = WithProgressBar(chunks, caption="Unused FileBlob chunks")
+
+    for chunk in chunks:
+        # Re-apply the anti-join so blobs referenced in the meantime are kept,
+        # and delete one by one so that `FileBlob.delete` can schedule the
+        # removal of the underlying file from storage.
+        for blob in queryset.filter(id__in=chunk):
+            blob.delete()
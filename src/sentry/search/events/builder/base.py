@@ -4,7 +4,7 @@ import math
 from collections.abc import Callable, Mapping, Sequence
 from datetime import datetime, timedelta
 from re import Match
-from typing import Any, Union, cast
+from typing import AbstractSet, Any, Union, cast
 
 import sentry_sdk
 from django.utils.functional import cached_property
@@ -90,9 +90,9 @@ class BaseQueryBuilder:
     profile_functions_metrics_builder = False
     entity: Entity | None = None
     config_class: type[DatasetConfig] | None = None
-    duration_fields: set[str] = set()
-    uuid_fields: set[str] = set()
-    span_id_fields: set[str] = set()
+    duration_fields: AbstractSet[str] = frozenset()
+    uuid_fields: AbstractSet[str] = frozenset()
+    span_id_fields: AbstractSet[str] = frozenset()
 
     def get_middle(self):
         """Get the middle for comparison functions"""
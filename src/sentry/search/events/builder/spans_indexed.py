@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from sentry_relay.consts import SPAN_STATUS_CODE_TO_NAME
 from snuba_sdk import AliasedExpression, Column, Function
 
@@ -12,31 +14,60 @@ from sentry.search.events.datasets.spans_indexed import (
 from sentry.search.events.fields import custom_time_processor
 from sentry.search.events.types import SelectType
 
-SPAN_UUID_FIELDS = {
-    "trace",
-    "trace_id",
-    "transaction.id",
-    "transaction_id",
-    "profile.id",
-    "profile_id",
-    "replay.id",
-    "replay_id",
-}
-
-
-SPAN_ID_FIELDS = {
-    "id",
-    "span_id",
-    "parent_span",
-    "parent_span_id",
-    "segment.id",
-    "segment_id",
-}
-
-DURATION_FIELDS = {
-    "span.duration",
-    "span.self_time",
-}
+SPAN_UUID_FIELDS = frozenset(
+    {
+        "trace",
+        "trace_id",
+        "transaction.id",
+        "transaction_id",
+        "profile.id",
+        "profile_id",
+        "replay.id",
+        "replay_id",
+    }
+)
+
+
+SPAN_ID_FIELDS = frozenset(
+    {
+        "id",
+        "span_id",
+        "parent_span",
+        "parent_span_id",
+        "segment.id",
+        "segment_id",
+    }
+)
+
+DURATION_FIELDS = frozenset(
+    {
+        "span.duration",
+        "span.self_time",
+    }
+)
+
+TYPED_ATTR_TYPES = frozenset({"number", "string"})
+
+
+@lru_cache(maxsize=4096)
+def _valid_field(field: str) -> bool:
+    # attr field is less permissive than tags, we can't have - in them
+    return constants.VALID_FIELD_PATTERN.match(field) is not None and "-" not in field
+
+
+@lru_cache(maxsize=2048)
+def _typed_attr_column(field_type: str, field: str, field_alias: str | None) -> Column:
+    # snuba_sdk expressions are immutable, so the same instance can be shared
+    # across queries instead of being rebuilt (and revalidated) on every call
+    if field_type == "string":
+        field_col = Column(f"attr_str[{field}]")
+    else:
+        field_col = Column(f"attr_num[{field}]")
+
+    if field_alias is not None:
+        return AliasedExpression(field_col, field_alias)
+
+    return field_col
 
 
 class SpansIndexedQueryBuilder(BaseQueryBuilder):
@@ -68,37 +99,28 @@ class SpansEAPQueryBuilder(BaseQueryBuilder):
         if len(raw_field) > constants.MAX_TAG_KEY_LENGTH:
             raise InvalidSearchQuery(f"{raw_field} is too long, can be a maximum of 200 characters")
 
-        tag_match = constants.TYPED_TAG_KEY_RE.search(raw_field)
-        field = tag_match.group("tag") if tag_match else None
-        field_type = tag_match.group("type") if tag_match else None
-        if (
-            field is None
-            or field_type is None
-            or not constants.VALID_FIELD_PATTERN.match(field)
-            # attr field is less permissive than tags, we can't have - in them
-            or "-" in field
-        ):
+        # typed tags always use the bracket form, so skip the regex for plain fields
+        tag_match = constants.TYPED_TAG_KEY_RE.search(raw_field) if "[" in raw_field else None
+        if tag_match is None:
             return super().resolve_field(raw_field, alias)
 
-        if field_type not in ["number", "string"]:
+        field, field_type = tag_match.group("tag", "type")
+        if not _valid_field(field):
+            return super().resolve_field(raw_field, alias)
+
+        if field_type not in TYPED_ATTR_TYPES:
             raise InvalidSearchQuery(
                 f"Unknown type for field {raw_field}, only string and number are supported"
             )
 
-        if field_type == "string":
-            field_col = Column(f"attr_str[{field}]")
-        else:
-            field_col = Column(f"attr_num[{field}]")
-
+        field_alias = None
         if alias:
             field_alias = f"tags_{field}@{field_type}"
 
             self.typed_tag_to_alias_map[raw_field] = field_alias
             self.alias_to_typed_tag_map[field_alias] = raw_field
 
-            field_col = AliasedExpression(field_col, field_alias)
-
-        return field_col
+        return _typed_attr_column(field_type, field, field_alias)
 
 
 class TimeseriesSpanIndexedQueryBuilder(TimeseriesQueryBuilder):
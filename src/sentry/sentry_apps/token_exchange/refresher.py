@@ -2,6 +2,7 @@ import logging
 from dataclasses import dataclass
 
 from django.db import router, transaction
+from django.utils import timezone
 from django.utils.functional import cached_property
 
 from sentry import analytics
@@ -9,7 +10,6 @@ from sentry.coreapi import APIUnauthorized
 from sentry.models.apiapplication import ApiApplication
 from sentry.models.apitoken import ApiToken
 from sentry.sentry_apps.models.sentry_app import SentryApp
-from sentry.sentry_apps.models.sentry_app_installation import SentryAppInstallation
 from sentry.sentry_apps.services.app import RpcSentryAppInstallation
 from sentry.sentry_apps.token_exchange.util import token_expiration
 from sentry.sentry_apps.token_exchange.validator import Validator
@@ -33,10 +33,9 @@ class Refresher:
         with transaction.atomic(router.db_for_write(ApiToken)):
             try:
                 self._validate()
-                self.token.delete()
 
                 self._record_analytics()
-                return self._create_new_token()
+                return self._rotate_token()
             except APIUnauthorized:
                 logger.info(
                     "refresher.context",
@@ -57,26 +56,32 @@ class Refresher:
     def _validate(self) -> None:
         Validator(install=self.install, client_id=self.client_id, user=self.user).run()
 
-        if self.token.application != self.application:
+        # Compare ids so the token's application doesn't have to be fetched
+        if self.token.application_id != self.application.id:
             raise APIUnauthorized("Token does not belong to the application")
 
-    def _create_new_token(self) -> ApiToken:
-        token = ApiToken.objects.create(
-            user=self.user,
-            application=self.application,
-            scope_list=self.sentry_app.scope_list,
+    def _rotate_token(self) -> ApiToken:
+        # Rotate the secrets on the existing row instead of deleting it and
+        # creating a new one. The installation keeps pointing at the same
+        # ApiToken, so it doesn't need to be updated.
+        self.token.refresh(
             expires_at=token_expiration(),
+            scope_list=self.sentry_app.scope_list,
+            date_added=timezone.now(),
         )
-        try:
-            SentryAppInstallation.objects.get(id=self.install.id).update(api_token=token)
-        except SentryAppInstallation.DoesNotExist:
-            pass
-        return token
+
+        # Store the plaintext tokens for one-time retrieval
+        self.token._set_plaintext_token(token=self.token.token)
+        self.token._set_plaintext_refresh_token(token=self.token.refresh_token)
+        return self.token
 
     @cached_property
     def token(self) -> ApiToken:
         try:
-            return ApiToken.objects.get(refresh_token=self.refresh_token)
+            # Lock the row so concurrent refreshes with the same refresh token
+            # are serialized. Once the first one commits the refresh token no
+            # longer matches, and the others fail with "Token does not exist".
+            return ApiToken.objects.select_for_update().get(refresh_token=self.refresh_token)
         except ApiToken.DoesNotExist:
             raise APIUnauthorized("Token does not exist")
 
@@ -87,7 +92,7 @@ class Refresher:
         except ApiApplication.DoesNotExist:
             raise APIUnauthorized("Application does not exist")
 
-    @property
+    @cached_property
     def sentry_app(self) -> SentryApp:
         try:
             return self.application.sentry_app
@@ -1,15 +1,47 @@
+import copy
 import logging
 import operator
+from collections.abc import Callable
 from enum import StrEnum
+from typing import Any
 
 from django.db import models
 
 from sentry.backup.scopes import RelocationScope
 from sentry.db.models import DefaultFieldsModel, region_silo_model, sane_repr
+from sentry.utils import metrics
 from sentry.workflow_engine.types import DataConditionResult, DetectorPriorityLevel
 
 logger = logging.getLogger(__name__)
 
+# Bounds how many distinct invalid conditions we remember having logged in this process.
+_MAX_LOGGED_INVALID_CONDITIONS = 1024
+_logged_invalid_conditions: set[tuple[int | None, str]] = set()
+
+
+def _should_log_invalid_condition(condition_id: int | None, kind: str) -> bool:
+    """
+    Only log each invalid (condition, kind) pair once per process, so a misconfigured condition
+    that's evaluated constantly doesn't flood the logs.
+    """
+    key = (condition_id, kind)
+    if key in _logged_invalid_conditions:
+        return False
+    if len(_logged_invalid_conditions) >= _MAX_LOGGED_INVALID_CONDITIONS:
+        _logged_invalid_conditions.clear()
+    _logged_invalid_conditions.add(key)
+    return True
+
+
+def _snapshot(value: Any) -> Any:
+    # JSON fields can hold containers that are mutated in place, so keep a copy of those
+    return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+
+def _matches_snapshot(snapshot: Any, value: Any) -> bool:
+    # Compare types too, since e.g. `True == 1` but they resolve to different results
+    return snapshot is value or (type(snapshot) is type(value) and snapshot == value)
+
 
 class Condition(StrEnum):
     EQUAL = "eq"
@@ -29,6 +61,17 @@ condition_ops = {
     Condition.NOT_EQUAL: operator.ne,
 }
 
+# Keyed by the raw stored value, so resolving an operator doesn't need to construct a Condition
+# (and catch its ValueError) first.
+_condition_ops_by_value: dict[str, Callable[[Any, Any], Any]] = {
+    condition.value: op for condition, op in condition_ops.items()
+}
+
+# Used to turn stored ints into priority levels without raising for values that aren't one.
+_priority_levels_by_value: dict[int, DetectorPriorityLevel] = {
+    level.value: level for level in DetectorPriorityLevel
+}
+
 
 @region_silo_model
 class DataCondition(DefaultFieldsModel):
@@ -55,50 +98,112 @@ class DataCondition(DefaultFieldsModel):
         "workflow_engine.DataConditionGroup",
         related_name="conditions",
         on_delete=models.CASCADE,
+        # Indexed by the covering index in Meta.indexes instead
+        db_index=False,
     )
 
+    class Meta:
+        indexes = [
+            # Covers the columns loaded when fetching the conditions of a group for evaluation, so
+            # that lookup can be answered with an index-only scan. Covering indexes must be named;
+            # this is the name Django generates for an index on condition_group.
+            models.Index(
+                fields=["condition_group"],
+                include=["id", "condition", "comparison", "condition_result", "type"],
+                name="workflow_en_conditi_3c2a7d_idx",
+            ),
+        ]
+
+    # Values derived from the stored fields, memoized together with a snapshot of the field values
+    # they were derived from. A memo is only reused while the fields still match their snapshot,
+    # so assigning to a field, mutating it in place or refreshing the instance invalidates it.
+    _condition_result_memo: tuple[Any, DataConditionResult]
+    _evaluation_memo: tuple[Any, Any, tuple[Callable[[Any, Any], Any], float] | None]
+
     def get_condition_result(self) -> DataConditionResult:
+        memo = self.__dict__.get("_condition_result_memo")
+        if memo is None or not _matches_snapshot(memo[0], self.condition_result):
+            memo = (_snapshot(self.condition_result), self._resolve_condition_result())
+            self._condition_result_memo = memo
+
+        condition_result = memo[1]
+        if condition_result is None:
+            # Only invalid stored values resolve to None
+            metrics.incr(
+                "workflow_engine.data_condition.invalid", tags={"kind": "condition_result"}
+            )
+        return condition_result
+
+    def _resolve_condition_result(self) -> DataConditionResult:
+        """
+        The stored `condition_result` coerced to a `DataConditionResult`.
+        """
         match self.condition_result:
             case float() | bool():
                 return self.condition_result
             case int() | DetectorPriorityLevel():
-                try:
-                    return DetectorPriorityLevel(self.condition_result)
-                except ValueError:
-                    return self.condition_result
+                return _priority_levels_by_value.get(self.condition_result, self.condition_result)
             case _:
-                logger.error(
-                    "Invalid condition result",
-                    extra={"condition_result": self.condition_result, "id": self.id},
-                )
+                if _should_log_invalid_condition(self.id, "condition_result"):
+                    logger.error(
+                        "Invalid condition result",
+                        extra={"condition_result": self.condition_result, "id": self.id},
+                    )
 
         return None
 
-    def evaluate_value(self, value: float | int) -> DataConditionResult:
+    def _get_evaluation(self) -> tuple[Callable[[Any, Any], Any], float] | None:
+        memo = self.__dict__.get("_evaluation_memo")
+        if (
+            memo is None
+            or not _matches_snapshot(memo[0], self.condition)
+            or not _matches_snapshot(memo[1], self.comparison)
+        ):
+            memo = (
+                _snapshot(self.condition),
+                _snapshot(self.comparison),
+                self._resolve_evaluation(),
+            )
+            self._evaluation_memo = memo
+        return memo[2]
+
+    def _resolve_evaluation(self) -> tuple[Callable[[Any, Any], Any], float] | None:
+        """
+        Resolve the operator and the comparison value for this condition. Invalid conditions
+        resolve to None.
+        """
         # TODO: This logic should be in a condition class that we get from `self.type`
         # TODO: This evaluation logic should probably go into the condition class, and we just produce a condition
         # class from this model
-        try:
-            condition = Condition(self.condition)
-        except ValueError:
-            logger.exception(
-                "Invalid condition", extra={"condition": self.condition, "id": self.id}
-            )
-            return None
-
-        op = condition_ops.get(condition)
+        op = _condition_ops_by_value.get(self.condition)
         if op is None:
-            logger.error("Invalid condition", extra={"condition": self.condition, "id": self.id})
+            if _should_log_invalid_condition(self.id, "condition"):
+                logger.error(
+                    "Invalid condition", extra={"condition": self.condition, "id": self.id}
+                )
             return None
 
         try:
+            # Cast once here, so numeric strings such as "5" compare correctly against the numeric
+            # values being evaluated.
             comparison = float(self.comparison)
-        except ValueError:
-            logger.exception(
-                "Invalid comparison value", extra={"comparison": self.comparison, "id": self.id}
-            )
+        except (TypeError, ValueError):
+            if _should_log_invalid_condition(self.id, "comparison"):
+                logger.exception(
+                    "Invalid comparison value", extra={"comparison": self.comparison, "id": self.id}
+                )
+            return None
+
+        return op, comparison
+
+    def evaluate_value(self, value: float | int) -> DataConditionResult:
+        evaluation = self._get_evaluation()
+        if evaluation is None:
+            kind = "condition" if self.condition not in _condition_ops_by_value else "comparison"
+            metrics.incr("workflow_engine.data_condition.invalid", tags={"kind": kind})
             return None
 
+        op, comparison = evaluation
         if op(value, comparison):
             return self.get_condition_result()
 
@@ -3,7 +3,7 @@ from typing import Any
 
 from sentry.utils.function_cache import cache_func_for_models
 from sentry.workflow_engine.models import DataCondition, DataConditionGroup
-from sentry.workflow_engine.types import ProcessedDataConditionResult
+from sentry.workflow_engine.types import DataConditionResult, ProcessedDataConditionResult
 
 logger = logging.getLogger(__name__)
 
@@ -13,18 +13,28 @@ logger = logging.getLogger(__name__)
     recalculate=False,
 )
 def get_data_conditions_for_group(data_condition_group_id: int) -> list[DataCondition]:
-    return list(DataCondition.objects.filter(condition_group_id=data_condition_group_id))
+    # Only load the columns that evaluation reads; the results are pickled into the cache, so
+    # narrower rows are cheaper both to fetch and to store.
+    return list(
+        DataCondition.objects.filter(condition_group_id=data_condition_group_id).only(
+            "condition", "comparison", "condition_result", "type", "condition_group_id"
+        )
+    )
 
 
 def evaluate_condition_group(
     data_condition_group: DataConditionGroup,
     value: Any,
+    conditions: list[DataCondition] | None = None,
 ) -> ProcessedDataConditionResult:
     """
     Evaluate the conditions for a given group and value.
+
+    Callers evaluating the same group repeatedly can pass in its `conditions` so that they are only
+    fetched once.
     """
-    results = []
-    conditions = get_data_conditions_for_group(data_condition_group.id)
+    if conditions is None:
+        conditions = get_data_conditions_for_group(data_condition_group.id)
 
     # TODO - @saponifi3d
     # Split the conditions into fast and slow conditions
@@ -35,36 +45,35 @@ def evaluate_condition_group(
         # if we don't have any conditions, always return True
         return True, []
 
+    logic_type = data_condition_group.logic_type
+    condition_results: list[DataConditionResult] = []
+
     for condition in conditions:
         evaluation_result = condition.evaluate_value(value)
-        is_condition_triggered = evaluation_result is not None
+        if evaluation_result is None:
+            if logic_type == DataConditionGroup.Type.ALL:
+                # The group can't pass anymore, so skip the remaining conditions
+                return False, []
+            continue
 
-        if is_condition_triggered:
-            # Check for short-circuiting evaluations
-            if data_condition_group.logic_type == data_condition_group.Type.ANY_SHORT_CIRCUIT:
-                return is_condition_triggered, [evaluation_result]
+        # Check for short-circuiting evaluations
+        if logic_type == DataConditionGroup.Type.ANY_SHORT_CIRCUIT:
+            return True, [evaluation_result]
 
-            if data_condition_group.logic_type == data_condition_group.Type.NONE:
-                return False, []
+        if logic_type == DataConditionGroup.Type.NONE:
+            return False, []
 
-        results.append((is_condition_triggered, evaluation_result))
+        condition_results.append(evaluation_result)
 
-    if data_condition_group.logic_type == data_condition_group.Type.NONE:
+    if logic_type == DataConditionGroup.Type.NONE:
         # if we get to this point, no conditions were met
         return True, []
-    elif data_condition_group.logic_type == data_condition_group.Type.ANY:
-        is_any_condition_met = any([result[0] for result in results])
-
-        if is_any_condition_met:
-            condition_results = [result[1] for result in results if result[0]]
-            return is_any_condition_met, condition_results
-    elif data_condition_group.logic_type == data_condition_group.Type.ALL:
-        conditions_met = [result[0] for result in results]
-        is_all_conditions_met = all(conditions_met)
-
-        if is_all_conditions_met:
-            condition_results = [result[1] for result in results if result[0]]
-            return is_all_conditions_met, condition_results
+    elif logic_type == DataConditionGroup.Type.ANY:
+        if condition_results:
+            return True, condition_results
+    elif logic_type == DataConditionGroup.Type.ALL:
+        # if we get to this point, all conditions were met
+        return True, condition_results
 
     return False, []
 
@@ -8,6 +8,7 @@ from typing import Any, Generic, TypeVar
 
 from django.conf import settings
 from django.db.models import Q
+from django.utils.functional import cached_property
 from sentry_redis_tools.retrying_cluster import RetryingRedisCluster
 
 from sentry.issues.issue_occurrence import IssueOccurrence
@@ -17,8 +18,17 @@ from sentry.models.group import GroupStatus
 from sentry.types.group import PriorityLevel
 from sentry.utils import metrics, redis
 from sentry.utils.iterators import chunked
-from sentry.workflow_engine.models import DataConditionGroup, DataPacket, Detector, DetectorState
-from sentry.workflow_engine.processors.data_condition_group import evaluate_condition_group
+from sentry.workflow_engine.models import (
+    DataCondition,
+    DataConditionGroup,
+    DataPacket,
+    Detector,
+    DetectorState,
+)
+from sentry.workflow_engine.processors.data_condition_group import (
+    evaluate_condition_group,
+    get_data_conditions_for_group,
+)
 from sentry.workflow_engine.types import DetectorGroupKey, DetectorPriorityLevel
 
 logger = logging.getLogger(__name__)
@@ -126,6 +136,16 @@ class DetectorHandler(abc.ABC, Generic[T]):
         else:
             self.condition_group = None
 
+    @cached_property
+    def conditions(self) -> list[DataCondition]:
+        """
+        The conditions of `condition_group`, fetched once per handler rather than once for every
+        group key that's evaluated.
+        """
+        if not self.condition_group:
+            return []
+        return get_data_conditions_for_group(self.condition_group.id)
+
     @abc.abstractmethod
     def evaluate(
         self, data_packet: DataPacket[T]
@@ -278,7 +298,7 @@ class StatefulDetectorHandler(DetectorHandler[T], abc.ABC):
         # level, but usually we want to set this at a higher level.
         new_status = DetectorPriorityLevel.OK
         is_group_condition_met, condition_results = evaluate_condition_group(
-            self.condition_group, value
+            self.condition_group, value, self.conditions
         )
 
         if is_group_condition_met:
@@ -388,6 +388,17 @@ class TestRpcSignatureAuthentication(TestCase):
         with pytest.raises(AuthenticationFailed):
             self.auth.authenticate(request)
 
+    @override_settings(RPC_SHARED_SECRET=["a-long-secret-key"])
+    def test_authenticate_malformed_signature(self):
+        for signature in ("rpc0:not-hex", "rpc0:abc", "rpc0:ab:cd"):
+            request = RequestFactory().post("/", data="", content_type="application/json")
+            request.META["HTTP_AUTHORIZATION"] = f"rpcsignature {signature}"
+
+            request = Request(request=request)
+
+            with pytest.raises(AuthenticationFailed):
+                self.auth.authenticate(request)
+
     def test_authenticate_no_shared_secret(self):
         request = RequestFactory().post("/", data="", content_type="application/json")
         request.META["HTTP_AUTHORIZATION"] = "rpcsignature abcdef"
@@ -1,4 +1,5 @@
 import pydantic
+import pytest
 
 from sentry.hybridcloud.rpc.sig import SerializableFunctionSignature
 from sentry.testutils.cases import TestCase
@@ -26,5 +27,17 @@ class SerializableFunctionSignatureTest(TestCase):
         assert hasattr(deserialized_arguments, "arg2")
         assert deserialized_arguments.arg2 == AnObject(a=2, b="bar")
 
+        deserialized_argument_dict = sig.deserialize_arguments_to_dict(serialized_arguments)
+        assert deserialized_argument_dict == deserialized_arguments.__dict__
+
         deserialized_return_value = sig.deserialize_return_value(dict(a=3, b="qux"))
         assert deserialized_return_value == AnObject(a=3, b="qux")
+
+    def test_none_return(self) -> None:
+        def a_function(arg: int) -> None:
+            pass
+
+        sig = SerializableFunctionSignature(a_function)
+        assert sig.deserialize_return_value(None) is None
+        with pytest.raises(pydantic.ValidationError):
+            sig.deserialize_return_value(1)
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import Any
+import datetime
+import uuid
+from decimal import Decimal
+from enum import Enum
+from typing import Any, NamedTuple
 from unittest import mock
 
 import pytest
@@ -14,6 +18,10 @@ from sentry.auth.services.auth import AuthService
 from sentry.hybridcloud.rpc.service import (
     RpcAuthenticationSetupException,
     RpcDisabledException,
+    RpcMethodSignature,
+    RpcServiceSetupException,
+    _encode_request_body,
+    _get_rpc_session,
     _RemoteSiloCall,
     dispatch_remote_call,
     dispatch_to_local_service,
@@ -308,3 +316,86 @@ class DispatchRemoteCallTest(TestCase):
         timeout_override_setting = {"organization_service.some_other_method": 20}
         with override_options({"hybridcloud.rpc.method_retry_overrides": timeout_override_setting}):
             assert test_class.get_method_retry_count() == default_value
+
+
+def test_signature_for_service_cls() -> None:
+    class ControlService:
+        key = "control"
+        local_mode = SiloMode.CONTROL
+
+    class OtherControlService:
+        key = "other_control"
+        local_mode = SiloMode.CONTROL
+
+    class RegionService:
+        key = "region"
+        local_mode = SiloMode.REGION
+
+    def method(self: Any, *, value: int) -> None:
+        pass
+
+    signature = RpcMethodSignature(ControlService, method)  # type: ignore[arg-type]
+    assert signature.for_service_cls(ControlService) is signature  # type: ignore[arg-type]
+
+    other = signature.for_service_cls(OtherControlService)  # type: ignore[arg-type]
+    assert other.service_key == "other_control"
+    assert signature.service_key == "control"
+    assert other.get_schemas() == signature.get_schemas()
+
+    # Region resolution is still checked against each class
+    with pytest.raises(RpcServiceSetupException):
+        signature.for_service_cls(RegionService)  # type: ignore[arg-type]
+
+
+class _Color(Enum):
+    RED = "red"
+
+
+class _Point(NamedTuple):
+    x: int
+    y: int
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("plain", b'"plain"'),
+        ("ünïcödé", b'"\\u00fcn\\u00efc\\u00f6d\\u00e9"'),
+        ([1, 2.5, None, True], b"[1,2.5,null,true]"),
+        ({1: "int key"}, b'{"1":"int key"}'),
+        (_Color.RED, b'"red"'),
+        (
+            datetime.datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.UTC),
+            b'"2024-01-02T03:04:05.678901Z"',
+        ),
+        (datetime.date(2024, 1, 2), b'"2024-01-02"'),
+        (datetime.time(3, 4, 5, 678901), b'"03:04:05.678"'),
+        (
+            uuid.UUID("c3b5a1d6-4f0e-4b8e-9c1d-2a3f4e5d6c7b"),
+            b'"c3b5a1d64f0e4b8e9c1d2a3f4e5d6c7b"',
+        ),
+        (Decimal("1.10"), b"1.10"),
+        (_Point(1, 2), b'{"x":1,"y":2}'),
+        (2**70, b"1180591620717411303424"),
+        (float("nan"), b"null"),
+    ],
+)
+def test_encode_request_body_wire_format(value: Any, expected: bytes) -> None:
+    request_body = {"meta": {}, "args": {"value": value}}
+    assert _encode_request_body(request_body) == b'{"meta":{},"args":{"value":' + expected + b"}}"
+
+
+@responses.activate
+def test_rpc_session_blocks_cookies() -> None:
+    responses.add(
+        responses.POST,
+        "http://na.sentry.io/api/0/internal/rpc/",
+        status=200,
+        headers={"Set-Cookie": "sessionid=abc; Path=/"},
+        json={},
+    )
+
+    session = _get_rpc_session(0)
+    session.post("http://na.sentry.io/api/0/internal/rpc/", data=b"{}")
+
+    assert len(session.cookies) == 0
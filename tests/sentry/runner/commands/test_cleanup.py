@@ -0,0 +1,137 @@
+import queue
+import threading
+from unittest import mock
+
+from sentry.models.group import Group
+from sentry.models.project import Project
+from sentry.runner.commands import cleanup
+from sentry.testutils.cases import TestCase
+
+GROUP_MODEL_NAME = "sentry.models.group.Group"
+
+
+def run_worker(*tasks, chunks=((3, 4),), maxsize=0):
+    task_queue = queue.Queue(maxsize)
+    for task in tasks:
+        task_queue.put(task)
+
+    # Record the tasks workers hand back to the queue
+    enqueued = []
+    put_nowait = task_queue.put_nowait
+
+    def record_put_nowait(task):
+        put_nowait(task)
+        enqueued.append(task)
+
+    task_queue.put_nowait = record_put_nowait
+
+    # Already set, so the worker exits as soon as the queue is drained
+    shutdown_event = threading.Event()
+    shutdown_event.set()
+
+    with (
+        mock.patch("sentry.runner.configure"),
+        mock.patch("sentry.deletions.get") as get_deletion_task,
+        mock.patch("sentry.db.deletion.BulkDeleteQuery") as bulk_delete_query,
+    ):
+        get_deletion_task.return_value.chunk.return_value = False
+        bulk_delete_query.return_value.iterator.side_effect = lambda chunk_size: iter(chunks)
+        cleanup.multiprocess_worker(task_queue, shutdown_event)
+
+    assert task_queue.unfinished_tasks == 0
+    return get_deletion_task, bulk_delete_query, enqueued
+
+
+def test_worker_deletes_task():
+    get_deletion_task, bulk_delete_query, _ = run_worker(
+        cleanup._DeletesTask(GROUP_MODEL_NAME, [(1, 2)])
+    )
+
+    assert not bulk_delete_query.called
+    get_deletion_task.assert_called_once_with(
+        model=Group, query={"id__in": (1, 2)}, skip_models=mock.ANY, transaction_id=mock.ANY
+    )
+
+
+def test_worker_bulk_query_delete_task():
+    get_deletion_task, bulk_delete_query, _ = run_worker(
+        cleanup._BulkQueryDeleteTask(GROUP_MODEL_NAME, "last_seen", 30, 5, "last_seen")
+    )
+
+    assert not get_deletion_task.called
+    bulk_delete_query.assert_called_once_with(
+        model=Group, dtfield="last_seen", days=30, project_id=5, order_by="last_seen"
+    )
+    bulk_delete_query.return_value.execute.assert_called_once_with(chunk_size=10000)
+
+
+def test_worker_project_delete_task():
+    get_deletion_task, bulk_delete_query, _ = run_worker(
+        cleanup._ProjectDeleteTask(GROUP_MODEL_NAME, "last_seen", 30, "last_seen", 5)
+    )
+
+    bulk_delete_query.assert_called_once_with(
+        model=Group, dtfield="last_seen", days=30, project_id=5, order_by="last_seen"
+    )
+    assert not bulk_delete_query.return_value.execute.called
+    assert [c.kwargs["query"] for c in get_deletion_task.call_args_list] == [{"id__in": (3, 4)}]
+
+
+def test_worker_project_delete_task_shares_chunks_of_a_dominant_project():
+    # Project 5 holds almost all of the rows. Its chunks go back on the shared queue as
+    # deletes tasks, so every worker can pick them up instead of the one that got project 5.
+    dominant_chunks = [(i,) for i in range(25)]
+    get_deletion_task, _, enqueued = run_worker(
+        cleanup._ProjectDeleteTask(GROUP_MODEL_NAME, "last_seen", 30, "last_seen", 5),
+        chunks=dominant_chunks,
+    )
+
+    assert enqueued == [
+        cleanup._DeletesTask(GROUP_MODEL_NAME, dominant_chunks[:10]),
+        cleanup._DeletesTask(GROUP_MODEL_NAME, dominant_chunks[10:20]),
+        cleanup._DeletesTask(GROUP_MODEL_NAME, dominant_chunks[20:]),
+    ]
+    assert [c.kwargs["query"] for c in get_deletion_task.call_args_list] == [
+        {"id__in": chunk} for chunk in dominant_chunks
+    ]
+
+
+def test_worker_project_delete_task_full_queue():
+    # Chunks that don't fit on the queue are deleted by the worker itself, instead of
+    # blocking while every other worker might be doing the same.
+    chunks = [(i,) for i in range(25)]
+    get_deletion_task, _, enqueued = run_worker(
+        cleanup._ProjectDeleteTask(GROUP_MODEL_NAME, "last_seen", 30, "last_seen", 5),
+        chunks=chunks,
+        maxsize=1,
+    )
+
+    assert enqueued == [cleanup._DeletesTask(GROUP_MODEL_NAME, chunks[:10])]
+    assert sorted(c.kwargs["query"]["id__in"] for c in get_deletion_task.call_args_list) == chunks
+
+
+def test_enqueue_project_deletes():
+    task_queue = queue.Queue()
+    cleanup.enqueue_project_deletes(task_queue, Group, "last_seen", 30, "last_seen", [1, 2, 3])
+
+    assert list(task_queue.queue) == [
+        cleanup._ProjectDeleteTask(GROUP_MODEL_NAME, "last_seen", 30, "last_seen", project_id)
+        for project_id in [1, 2, 3]
+    ]
+
+
+class GetProjectIdsForDeletionTest(TestCase):
+    def setUp(self):
+        self.project_ids = sorted(self.create_project().id for _ in range(3))
+        self.query = Project.objects.filter(id__in=self.project_ids)
+
+    def test_materialized(self):
+        project_ids = cleanup.get_project_ids_for_deletion(self.query)
+        assert isinstance(project_ids, list)
+        assert project_ids == self.project_ids
+
+    def test_paged(self):
+        with mock.patch.object(cleanup, "MAX_MATERIALIZED_PROJECT_IDS", 2):
+            project_ids = cleanup.get_project_ids_for_deletion(self.query)
+        assert not isinstance(project_ids, list)
+        assert list(project_ids) == self.project_ids
@@ -138,8 +138,10 @@ class TestSentryAppAuthorizations(APITestCase):
         assert response.data["refreshToken"] != refresh_token
         assert response.data["expiresAt"] > timezone.now()
 
-        old_token = ApiToken.objects.filter(id=token_id)
-        assert not old_token.exists()
+        # The token is rotated in place, so the row is kept but the old secrets are gone
+        assert response.data["id"] == token_id
+        assert not ApiToken.objects.filter(token=token).exists()
+        assert not ApiToken.objects.filter(refresh_token=refresh_token).exists()
 
         new_token = ApiToken.objects.filter(token=response.data["token"])
         assert new_token.exists()
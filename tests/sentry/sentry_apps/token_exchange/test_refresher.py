@@ -1,6 +1,8 @@
+from datetime import timedelta
 from unittest.mock import patch
 
 import pytest
+from django.utils import timezone
 
 from sentry.coreapi import APIUnauthorized
 from sentry.models.apiapplication import ApiApplication
@@ -38,9 +40,44 @@ class TestRefresher(TestCase):
         token = self.refresher.run()
         assert SentryAppInstallation.objects.get(id=self.install.id).api_token == token
 
-    def test_deletes_refreshed_token(self):
+    def test_rotates_refreshed_token(self):
+        old_token = self.token.token
+        old_refresh_token = self.token.refresh_token
+
+        token = self.refresher.run()
+
+        assert token.id == self.token.id
+        token = ApiToken.objects.get(id=self.token.id)
+        assert token.token != old_token
+        assert token.refresh_token != old_refresh_token
+        assert not ApiToken.objects.filter(refresh_token=old_refresh_token).exists()
+
+    def test_returns_plaintext_secrets(self):
+        token = self.refresher.run()
+        stored = ApiToken.objects.get(id=token.id)
+
+        assert token.plaintext_token == stored.token
+        assert token.plaintext_refresh_token == stored.refresh_token
+
+    def test_resets_date_added(self):
+        ApiToken.objects.filter(id=self.token.id).update(
+            date_added=timezone.now() - timedelta(days=30)
+        )
+
+        token = self.refresher.run()
+
+        assert ApiToken.objects.get(id=token.id).date_added > timezone.now() - timedelta(minutes=1)
+
+    def test_refresh_token_cannot_be_reused(self):
         self.refresher.run()
-        assert not ApiToken.objects.filter(id=self.token.id).exists()
+
+        with pytest.raises(APIUnauthorized):
+            Refresher(
+                install=self.install,
+                client_id=self.client_id,
+                refresh_token=self.token.refresh_token,
+                user=self.user,
+            ).run()
 
     def test_validates_token_belongs_to_sentry_app(self):
         refresh_token = ApiToken.objects.create(
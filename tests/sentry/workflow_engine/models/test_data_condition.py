@@ -1,9 +1,19 @@
 from unittest import mock
 
+import pytest
+
 from sentry.testutils.cases import TestCase
+from sentry.workflow_engine.models import DataCondition, data_condition
 from sentry.workflow_engine.types import DetectorPriorityLevel
 
 
+@pytest.fixture(autouse=True)
+def reset_logged_invalid_conditions():
+    data_condition._logged_invalid_conditions.clear()
+    yield
+    data_condition._logged_invalid_conditions.clear()
+
+
 class GetConditionResultTest(TestCase):
     def test_str(self):
         dc = self.create_data_condition(condition_result="wrong")
@@ -33,6 +43,23 @@ class GetConditionResultTest(TestCase):
         dc = self.create_data_condition(condition_result=True)
         assert dc.get_condition_result() is True
 
+    def test_field_updated(self):
+        dc = self.create_data_condition(condition_result=DetectorPriorityLevel.HIGH)
+        assert dc.get_condition_result() == DetectorPriorityLevel.HIGH
+
+        dc.condition_result = DetectorPriorityLevel.LOW
+        assert dc.get_condition_result() == DetectorPriorityLevel.LOW
+
+        # True == 1, but they resolve to different results
+        dc.condition_result = 1
+        assert dc.get_condition_result() == 1
+        dc.condition_result = True
+        assert dc.get_condition_result() is True
+
+        DataCondition.objects.filter(id=dc.id).update(condition_result=True)
+        dc.refresh_from_db()
+        assert dc.get_condition_result() is True
+
 
 class EvaluateValueTest(TestCase):
     def test(self):
@@ -42,13 +69,45 @@ class EvaluateValueTest(TestCase):
         assert dc.evaluate_value(2) == DetectorPriorityLevel.HIGH
         assert dc.evaluate_value(1) is None
 
+    def test_fields_updated(self):
+        dc = self.create_data_condition(
+            condition="gt", comparison=1.0, condition_result=DetectorPriorityLevel.HIGH
+        )
+        assert dc.evaluate_value(2) == DetectorPriorityLevel.HIGH
+
+        dc.comparison = 5.0
+        assert dc.evaluate_value(2) is None
+
+        dc.condition = "lt"
+        assert dc.evaluate_value(2) == DetectorPriorityLevel.HIGH
+
+        DataCondition.objects.filter(id=dc.id).update(condition="gt", comparison=0.0)
+        dc.refresh_from_db()
+        assert dc.evaluate_value(2) == DetectorPriorityLevel.HIGH
+        assert dc.evaluate_value(-1) is None
+
+    def test_comparison_mutated_in_place(self):
+        dc = self.create_data_condition(
+            condition="gt", comparison={"value": 1}, condition_result=DetectorPriorityLevel.HIGH
+        )
+        with mock.patch.object(
+            DataCondition, "_resolve_evaluation", autospec=True, return_value=None
+        ) as resolve_evaluation:
+            assert dc.evaluate_value(2) is None
+            assert dc.evaluate_value(2) is None
+            assert resolve_evaluation.call_count == 1
+
+            dc.comparison["value"] = 5
+            assert dc.evaluate_value(2) is None
+            assert resolve_evaluation.call_count == 2
+
     def test_bad_condition(self):
         dc = self.create_data_condition(
             condition="invalid", comparison=1.0, condition_result=DetectorPriorityLevel.HIGH
         )
         with mock.patch("sentry.workflow_engine.models.data_condition.logger") as mock_logger:
             assert dc.evaluate_value(2) is None
-            assert mock_logger.exception.call_args[0][0] == "Invalid condition"
+            assert mock_logger.error.call_args[0][0] == "Invalid condition"
 
     def test_bad_comparison(self):
         dc = self.create_data_condition(
@@ -58,8 +117,55 @@ class EvaluateValueTest(TestCase):
             assert dc.evaluate_value(2) is None
             assert mock_logger.exception.call_args[0][0] == "Invalid comparison value"
 
+    def test_comparison_string(self):
+        dc = self.create_data_condition(
+            condition="gt", comparison="5", condition_result=DetectorPriorityLevel.HIGH
+        )
+        assert dc.evaluate_value(10) == DetectorPriorityLevel.HIGH
+        assert dc.evaluate_value(5) is None
+
+    def test_non_scalar_comparison(self):
+        dc = self.create_data_condition(
+            condition="gt", comparison={"value": 1}, condition_result=DetectorPriorityLevel.HIGH
+        )
+        with mock.patch("sentry.workflow_engine.models.data_condition.logger") as mock_logger:
+            assert dc.evaluate_value(2) is None
+            assert mock_logger.exception.call_args[0][0] == "Invalid comparison value"
+
     def test_bad_condition_result(self):
         dc = self.create_data_condition(condition="gt", comparison=1.0, condition_result="wrong")
         with mock.patch("sentry.workflow_engine.models.data_condition.logger") as mock_logger:
             assert dc.evaluate_value(2) is None
             assert mock_logger.error.call_args[0][0] == "Invalid condition result"
+
+    def test_bad_condition_logged_once(self):
+        dc = self.create_data_condition(
+            condition="invalid", comparison=1.0, condition_result=DetectorPriorityLevel.HIGH
+        )
+        with mock.patch("sentry.workflow_engine.models.data_condition.logger") as mock_logger:
+            assert dc.evaluate_value(2) is None
+            assert dc.evaluate_value(3) is None
+            assert mock_logger.error.call_count == 1
+
+    def test_bad_condition_logged_once_across_instances(self):
+        dc = self.create_data_condition(
+            condition="invalid", comparison=1.0, condition_result=DetectorPriorityLevel.HIGH
+        )
+        reloaded = DataCondition.objects.get(id=dc.id)
+        with mock.patch("sentry.workflow_engine.models.data_condition.logger") as mock_logger:
+            assert dc.evaluate_value(2) is None
+            assert reloaded.evaluate_value(2) is None
+            assert mock_logger.error.call_count == 1
+
+    def test_bad_condition_counted_every_evaluation(self):
+        dc = self.create_data_condition(
+            condition="invalid", comparison=1.0, condition_result=DetectorPriorityLevel.HIGH
+        )
+        with mock.patch("sentry.workflow_engine.models.data_condition.metrics") as mock_metrics:
+            assert dc.evaluate_value(2) is None
+            assert dc.evaluate_value(3) is None
+
+        assert mock_metrics.incr.call_count == 2
+        mock_metrics.incr.assert_called_with(
+            "workflow_engine.data_condition.invalid", tags={"kind": "condition"}
+        )
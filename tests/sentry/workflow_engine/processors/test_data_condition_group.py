@@ -99,6 +99,20 @@ class TestEvaluateConditionGroupTypeAny(TestCase):
             [],
         )
 
+    def test_evaluate_condition_group__prefetched_conditions(self):
+        with mock.patch(
+            "sentry.workflow_engine.processors.data_condition_group.get_data_conditions_for_group"
+        ) as mock_get_conditions:
+            assert evaluate_condition_group(
+                self.data_condition_group,
+                4,
+                [self.data_condition_two],
+            ) == (
+                True,
+                [DetectorPriorityLevel.LOW],
+            )
+            mock_get_conditions.assert_not_called()
+
     def test_evaluate_condition_group__passes_without_conditions(self):
         data_condition_group = self.create_data_condition_group(
             logic_type=DataConditionGroup.Type.ANY
@@ -202,6 +216,14 @@ class TestEvaluateConditionGroupTypeAll(TestCase):
             [],
         )
 
+    def test_evaluate_condition_group__stops_at_first_failure(self):
+        with mock.patch.object(self.data_condition_two, "evaluate_value") as mock_evaluate:
+            assert evaluate_condition_group(self.data_condition_group, 4, self.conditions) == (
+                False,
+                [],
+            )
+            mock_evaluate.assert_not_called()
+
     def test_evaluate_condition_group__passes_without_conditions(self):
         data_condition_group = self.create_data_condition_group(
             logic_type=DataConditionGroup.Type.ALL